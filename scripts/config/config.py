@@ -1,6 +1,8 @@
 import os
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+from modules.scheduler import DEFAULT_SHARES
 
 
 @dataclass
@@ -59,6 +61,10 @@ class Preferences:
         "Visakhapatnam IT jobs",
     ])
 
+    # Sources (see modules/registry.py); only enabled ones are imported
+    job_sources: List[str] = field(default_factory=lambda: ["jsearch"])
+    news_sources: List[str] = field(default_factory=lambda: ["google_news"])
+
     # Delivery preferences
     send_whatsapp: bool = True
     send_email: bool = True
@@ -69,23 +75,30 @@ class Preferences:
     max_jobs_in_digest: int = 20
     max_news_in_digest: int = 10
 
+    # Run time budget (see modules/scheduler.py); shares are fractions of the deadline, one per stage, summing to <= 1
+    run_deadline_seconds: int = 600
+    stage_budget_shares: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_SHARES))
+
     # Data paths
     data_dir: str = "scripts/data"
     cache_file: str = "scripts/data/job_cache.json"
+    report_file: str = "scripts/data/run_report.json"
 
 
 @dataclass
 class Secrets:
+    # Values are read when Secrets() is instantiated (after .env is loaded), not at import time.
+
     # Jobs API
-    rapidapi_key: Optional[str] = os.getenv("RAPIDAPI_KEY")  # for JSearch
+    rapidapi_key: Optional[str] = field(default_factory=lambda: os.getenv("RAPIDAPI_KEY"))  # for JSearch
 
     # WhatsApp via Twilio
-    twilio_account_sid: Optional[str] = os.getenv("TWILIO_ACCOUNT_SID")
-    twilio_auth_token: Optional[str] = os.getenv("TWILIO_AUTH_TOKEN")
-    twilio_whatsapp_from: Optional[str] = os.getenv("TWILIO_WHATSAPP_FROM")  # e.g., 'whatsapp:+14155238886'
-    whatsapp_to: Optional[str] = os.getenv("WHATSAPP_TO")  # e.g., 'whatsapp:+91XXXXXXXXXX'
+    twilio_account_sid: Optional[str] = field(default_factory=lambda: os.getenv("TWILIO_ACCOUNT_SID"))
+    twilio_auth_token: Optional[str] = field(default_factory=lambda: os.getenv("TWILIO_AUTH_TOKEN"))
+    twilio_whatsapp_from: Optional[str] = field(default_factory=lambda: os.getenv("TWILIO_WHATSAPP_FROM"))  # e.g., 'whatsapp:+14155238886'
+    whatsapp_to: Optional[str] = field(default_factory=lambda: os.getenv("WHATSAPP_TO"))  # e.g., 'whatsapp:+91XXXXXXXXXX'
 
     # Email (Gmail SMTP)
-    smtp_user: Optional[str] = os.getenv("SMTP_GMAIL_USER")  # your@gmail.com
-    smtp_app_password: Optional[str] = os.getenv("SMTP_GMAIL_APP_PASSWORD")  # app password
-    email_to: Optional[str] = os.getenv("EMAIL_TO")  # destination email
+    smtp_user: Optional[str] = field(default_factory=lambda: os.getenv("SMTP_GMAIL_USER"))  # your@gmail.com
+    smtp_app_password: Optional[str] = field(default_factory=lambda: os.getenv("SMTP_GMAIL_APP_PASSWORD"))  # app password
+    email_to: Optional[str] = field(default_factory=lambda: os.getenv("EMAIL_TO"))  # destination email
@@ -1,17 +1,18 @@
 import argparse
 import json
 import os
-from datetime import datetime
-from typing import List, Dict, Any
-
-from dotenv import load_dotenv
-import pytz
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional
 
 from config.config import Preferences, Secrets
-from modules.job_scraper import fetch_jobs_jsearch
-from modules.news_scraper import fetch_google_news_rss
-from modules.filter import score_and_filter_jobs, dedupe_jobs
-from modules.notifier import build_digest_text, build_digest_html, send_whatsapp_via_twilio, send_email_via_gmail
+from modules import registry
+from modules.scheduler import DEFAULT_SHARES, RunBudget
+
+# Scrapers, notifiers and their third-party deps are imported on demand via
+# modules.registry so a run only pays for what it has enabled.
+
+IST = timezone(timedelta(hours=5, minutes=30), "IST")  # fixed offset; avoids importing pytz
 
 
 def ensure_data_dir(path: str):
@@ -47,82 +48,149 @@ def filter_out_previous(jobs: List[Dict[str, Any]], seen_ids: List[str]) -> List
     return out
 
 
-def run_once():
+def save_report(report_path: str, report: Dict[str, Any]):
+    try:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"[main] Failed to save run report: {e}")
+
+
+def build_fallback_digest(jobs: List[Dict[str, Any]], news: List[Dict[str, Any]]) -> tuple:
+    text = (
+        "📢 Daily Job & News Update\n\n"
+        f"Digest rendering ran out of time; collected {len(jobs)} jobs and {len(news)} news items."
+    )
+    return text, f"<html><body><p>{text}</p></body></html>"
+
+
+def run_once(deadline_seconds: Optional[float] = None):
     prefs = Preferences()
     secrets = Secrets()
+    total_seconds = deadline_seconds if deadline_seconds is not None else prefs.run_deadline_seconds
+    try:
+        budget = RunBudget(total_seconds, prefs.stage_budget_shares)
+    except ValueError as e:
+        # A bad shares edit must not stop the digest from going out.
+        print(f"[main] Invalid stage_budget_shares ({e}) — using defaults.")
+        budget = RunBudget(total_seconds, DEFAULT_SHARES)
 
     ensure_data_dir(prefs.data_dir)
 
-    # 1) Fetch jobs
+    # 1) Fetch jobs from enabled sources; each gets whatever is left of the fetch budget
     all_jobs: List[Dict[str, Any]] = []
-    all_jobs += fetch_jobs_jsearch(
-        rapidapi_key=secrets.rapidapi_key,
-        titles=prefs.titles,
-        locations=prefs.locations_allowed,
-        max_results=100,
-    )
-    # Future: add LinkedIn/Naukri/Indeed/company fetchers
+    for name, entry in registry.enabled(registry.JOB_SOURCES, prefs.job_sources).items():
+        all_jobs += budget.run(
+            f"fetch:{name}",
+            lambda d, out, entry=entry: registry.resolve(entry)(deadline=d, out=out, **entry.kwargs(prefs, secrets)),
+            fallback=[],
+            collect=True,  # keep what was fetched if the source overruns
+        )
+
+    # 2) Fetch news from enabled sources
+    news: List[Dict[str, Any]] = []
+    for name, entry in registry.enabled(registry.NEWS_SOURCES, prefs.news_sources).items():
+        news += budget.run(
+            f"news:{name}",
+            lambda d, out, entry=entry: registry.resolve(entry)(deadline=d, out=out, **entry.kwargs(prefs, secrets)),
+            fallback=[],
+            collect=True,  # keep what was fetched if the source overruns
+        )
+    news = news[: prefs.max_news_in_digest]
 
-    # 2) Dedupe and filter
-    all_jobs = dedupe_jobs(all_jobs)
+    # 3) Dedupe and filter
+    from modules import filter as filters
+    all_jobs = filters.dedupe_jobs(all_jobs)
     # Remove previously seen (today’s digest should be fresh; optional)
     seen_ids = load_cache(prefs.cache_file)
     unseen_jobs = filter_out_previous(all_jobs, seen_ids)
 
-    filtered_jobs = score_and_filter_jobs(
-        jobs=unseen_jobs,
-        titles=prefs.titles,
-        skills=prefs.skills,
-        onsite_cities_allowed=prefs.onsite_cities_allowed,
-        locations_allowed=prefs.locations_allowed,
-        min_lpa=prefs.min_salary_lpa,
-        max_lpa=prefs.max_salary_lpa,
-        exp_levels=prefs.experience_levels,
-        min_skill_match_to_include=prefs.min_skill_match_percent_to_include,
+    # CPU-only over a capped list, so it runs inline rather than in a cancellable worker
+    filtered_jobs = budget.run_inline(
+        "scoring",
+        lambda: filters.score_and_filter_jobs(
+            jobs=unseen_jobs,
+            titles=prefs.titles,
+            skills=prefs.skills,
+            onsite_cities_allowed=prefs.onsite_cities_allowed,
+            locations_allowed=prefs.locations_allowed,
+            min_lpa=prefs.min_salary_lpa,
+            max_lpa=prefs.max_salary_lpa,
+            exp_levels=prefs.experience_levels,
+            min_skill_match_to_include=prefs.min_skill_match_percent_to_include,
+        ),
+        fallback=unseen_jobs,  # unscored; better than aborting before render/send
     )
     filtered_jobs = filtered_jobs[: prefs.max_jobs_in_digest]
 
-    # 3) Fetch news
-    news = fetch_google_news_rss(prefs.news_topics, limit_per_topic=2)
-    news = news[: prefs.max_news_in_digest]
-
     # 4) Build digest
-    text_digest = build_digest_text(filtered_jobs, news)
-    html_digest = build_digest_html(filtered_jobs, news)
-    today = datetime.now(pytz.timezone("Asia/Kolkata")).strftime("%d %b %Y")
+    from modules import notifier
+    text_digest, html_digest = budget.run(
+        "rendering",
+        lambda d: (notifier.build_digest_text(filtered_jobs, news), notifier.build_digest_html(filtered_jobs, news)),
+        fallback=build_fallback_digest(filtered_jobs, news),
+    )
+    today = datetime.now(IST).strftime("%d %b %Y")
     subject = f"Daily Jobs & News Digest — {today}"
 
-    # 5) Notify
-    if prefs.send_whatsapp:
-        send_whatsapp_via_twilio(
-            account_sid=secrets.twilio_account_sid,
-            auth_token=secrets.twilio_auth_token,
-            from_whatsapp=secrets.twilio_whatsapp_from,
-            to_whatsapp=secrets.whatsapp_to,
-            body=text_digest,
-        )
-    if prefs.send_email:
-        send_email_via_gmail(
-            smtp_user=secrets.smtp_user,
-            app_password=secrets.smtp_app_password,
-            to_email=secrets.email_to,
-            subject=subject,
-            html_body=html_digest,
-            text_body=text_digest,
+    # 5) Notify on enabled channels; remaining time is split evenly so one slow channel can't starve the rest
+    channels = registry.enabled_notifiers(prefs)
+    for i, (name, entry) in enumerate(channels.items()):
+        channel_deadline = time.monotonic() + budget.remaining() / (len(channels) - i)
+        budget.run(
+            f"delivery:{name}",
+            lambda d, out, entry=entry: registry.resolve(entry)(
+                deadline=d, out=out, **entry.kwargs(prefs, secrets, subject, text_digest, html_digest)
+            ),
+            fallback=False,
+            deadline=channel_deadline,
+            collect=True,  # lets the sender report dropped messages as truncated
         )
 
     # 6) Save cache to avoid duplicates next runs
     save_cache(prefs.cache_file, filtered_jobs)
 
+    # 7) Record stage timings and which stages were degraded
+    report = budget.report()
+    save_report(prefs.report_file, report)
+    if report["degraded"]:
+        print(f"[main] Degraded stages: {', '.join(report['degraded'])}")
+
+
+def positive_seconds(value: str) -> float:
+    seconds = float(value)
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive number of seconds, got {value}")
+    return seconds
+
+
+def print_startup_profile(times: Dict[str, Optional[float]]):
+    print("[main] Startup import times (ms):")
+    measured = {name: ms for name, ms in times.items() if ms is not None}
+    for name, ms in sorted(measured.items(), key=lambda kv: kv[1], reverse=True):
+        print(f"  {ms:8.1f}  {name}")
+    for name in [name for name, ms in times.items() if ms is None]:
+        print(f"  {'failed':>8}  {name}")
+    print(f"  {sum(measured.values()):8.1f}  total")
+
 
 def main():
-    load_dotenv()  # load env if provided by runtime
     parser = argparse.ArgumentParser(description="AI Job & News Assistant — Phase 1")
     parser.add_argument("--once", action="store_true", help="Run once immediately (default).")
+    parser.add_argument("--deadline", type=positive_seconds, default=None, help="Total run time budget in seconds (default: Preferences.run_deadline_seconds).")
+    parser.add_argument("--profile-startup", action="store_true", help="Report per-module import time for the enabled sources/channels and exit.")
     args = parser.parse_args()
 
+    if args.profile_startup:
+        print_startup_profile(registry.profile_startup(Preferences()))
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv()  # load env if provided by runtime
+
     # For Phase 1 in this environment, we run once.
-    run_once()
+    run_once(deadline_seconds=args.deadline)
 
 
 if __name__ == "__main__":
@@ -16,10 +16,15 @@ def fetch_jobs_jsearch(
     titles: List[str],
     locations: List[str],
     max_results: int = 50,
+    deadline: Optional[float] = None,
+    out: Optional[List[Dict[str, Any]]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Fetch jobs using JSearch API on RapidAPI.
     Falls back to empty list if API key is not provided.
+    If `deadline` (time.monotonic() value) is given, stops querying once it passes and returns what was fetched.
+    Jobs are appended to `out` as they arrive (see modules.scheduler.Collected, whose `truncated`
+    flag is set when the deadline cuts the fetch short).
     """
     if not rapidapi_key:
         print("[job_scraper] RAPIDAPI_KEY not set — skipping JSearch fetch.")
@@ -30,7 +35,7 @@ def fetch_jobs_jsearch(
         "x-rapidapi-host": "jsearch.p.rapidapi.com",
     }
 
-    jobs: List[Dict[str, Any]] = []
+    jobs: List[Dict[str, Any]] = out if out is not None else []
     titles = list(dict.fromkeys(titles))  # unique preserve order
     locations = list(dict.fromkeys(locations))
 
@@ -38,6 +43,12 @@ def fetch_jobs_jsearch(
         for location in locations:
             # Construct query; JSearch supports "query" like "java developer in hyderabad"
             q = f"{title} in {location}"
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                print(f"[job_scraper] Deadline reached — returning {len(jobs)} jobs fetched so far.")
+                if hasattr(jobs, "truncated"):
+                    jobs.truncated = True
+                return jobs[:max_results]
             params = {
                 "query": q,
                 "page": "1",
@@ -45,13 +56,14 @@ def fetch_jobs_jsearch(
                 "date_posted": "all",  # or last_24_hours / week
             }
             try:
-                res = requests.get(JSEARCH_BASE, headers=headers, params=params, timeout=20)
+                timeout = 20 if remaining is None else min(20, remaining)
+                res = requests.get(JSEARCH_BASE, headers=headers, params=params, timeout=timeout)
                 res.raise_for_status()
                 data = res.json()
                 result_list = data.get("data", [])
-                for item in result_list:
+                for item in result_list[: max_results - len(jobs)]:
                     jobs.append(_map_jsearch_item(item))
-                time.sleep(0.6)  # be nice to the API
+                time.sleep(0.6 if deadline is None else max(0.0, min(0.6, deadline - time.monotonic())))  # be nice to the API
             except Exception as e:
                 print(f"[job_scraper] JSearch fetch error for '{q}': {e}")
 
@@ -1,18 +1,37 @@
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional
 import feedparser
+import requests
 from urllib.parse import quote_plus
 
 
-def fetch_google_news_rss(topics: List[str], limit_per_topic: int = 5) -> List[Dict[str, Any]]:
+def fetch_google_news_rss(
+    topics: List[str],
+    limit_per_topic: int = 5,
+    deadline: Optional[float] = None,
+    out: Optional[List[Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
     """
     Fetch Google News RSS for given topics.
+    If `deadline` (time.monotonic() value) is given, stops before the next topic once it passes.
+    Articles are appended to `out` as they arrive (see modules.scheduler.Collected, whose `truncated`
+    flag is set when the deadline cuts the fetch short).
     """
-    articles: List[Dict[str, Any]] = []
+    articles: List[Dict[str, Any]] = out if out is not None else []
     for topic in topics:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            print(f"[news_scraper] Deadline reached — returning {len(articles)} articles fetched so far.")
+            if hasattr(articles, "truncated"):
+                articles.truncated = True
+            break
         query = quote_plus(topic)
         url = f"https://news.google.com/rss/search?q={query}&hl=en-IN&gl=IN&ceid=IN:en"
         try:
-            feed = feedparser.parse(url)
+            # Fetch with requests so the download is bounded; feedparser.parse(url) has no timeout.
+            res = requests.get(url, timeout=20 if remaining is None else min(20, remaining))
+            res.raise_for_status()
+            feed = feedparser.parse(res.content)
             for entry in feed.entries[:limit_per_topic]:
                 articles.append({
                     "title": entry.get("title"),
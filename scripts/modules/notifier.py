@@ -1,8 +1,8 @@
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import time
 from typing import List, Dict, Any, Optional
-import requests
+
+# Transport libraries (requests, smtplib, email.mime) are imported inside the
+# send_* functions so that enabling one channel doesn't pay for the other.
 
 def build_digest_text(jobs: List[Dict[str, Any]], news: List[Dict[str, Any]]) -> str:
     lines = []
@@ -104,31 +104,50 @@ def send_whatsapp_via_twilio(
     from_whatsapp: Optional[str],
     to_whatsapp: Optional[str],
     body: str,
+    deadline: Optional[float] = None,
+    out: Optional[List[int]] = None,
 ) -> bool:
+    """
+    If `deadline` (time.monotonic() value) is given, each chunk's request is bounded by it
+    and no further chunks are sent once it passes.
+    Sent chunk numbers are appended to `out` (see modules.scheduler.Collected, whose `truncated`
+    flag is set if any chunk was dropped). Returns True if at least one chunk was sent.
+    """
     if not (account_sid and auth_token and from_whatsapp and to_whatsapp):
         print("[notifier] Missing Twilio WhatsApp env vars — printing to console instead.\n")
         print(body)
         return False
 
+    import requests
+
     url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
 
     # WhatsApp text practical size limit; chunk to be safe.
     chunks = _chunk_text(body, limit=1400)
-    any_success = False
+    sent: List[int] = out if out is not None else []
 
     for idx, part in enumerate(chunks, start=1):
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            print(f"[notifier] Deadline reached — {len(chunks) - idx + 1} WhatsApp chunk(s) not sent.")
+            if hasattr(sent, "truncated"):
+                sent.truncated = True
+            break
         data = {"From": from_whatsapp, "To": to_whatsapp, "Body": part}
         try:
-            resp = requests.post(url, data=data, auth=(account_sid, auth_token), timeout=20)
+            timeout = 20 if remaining is None else min(20, remaining)
+            resp = requests.post(url, data=data, auth=(account_sid, auth_token), timeout=timeout)
             if 200 <= resp.status_code < 300:
                 print(f"[notifier] WhatsApp chunk {idx}/{len(chunks)} sent.")
-                any_success = True
+                sent.append(idx)
             else:
                 print(f"[notifier] Twilio error {resp.status_code} on chunk {idx}: {resp.text}")
         except Exception as e:
             print(f"[notifier] Twilio request failed on chunk {idx}: {e}")
 
-    return any_success
+    if sent and len(sent) < len(chunks) and hasattr(sent, "truncated"):
+        sent.truncated = True  # partial delivery
+    return bool(sent)
 
 def send_email_via_gmail(
     smtp_user: Optional[str],
@@ -137,12 +156,23 @@ def send_email_via_gmail(
     subject: str,
     html_body: str,
     text_body: Optional[str] = None,
+    deadline: Optional[float] = None,
+    out: Optional[List[str]] = None,
 ) -> bool:
+    """
+    If `deadline` (time.monotonic() value) is given, it bounds each SMTP socket operation.
+    The recipient is appended to `out` once sent; if the deadline has already passed, nothing
+    is sent and `out.truncated` is set (see modules.scheduler.Collected).
+    """
     if not (smtp_user and app_password and to_email):
         print("[notifier] Missing Gmail SMTP env vars — printing to console instead.\n")
         print(text_body or "")
         return False
 
+    import smtplib
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
     msg["From"] = smtp_user
@@ -152,11 +182,23 @@ def send_email_via_gmail(
         msg.attach(MIMEText(text_body, "plain"))
     msg.attach(MIMEText(html_body, "html"))
 
+    timeout_kwargs = {}
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            print("[notifier] Deadline reached — email not sent.")
+            if hasattr(out, "truncated"):
+                out.truncated = True
+            return False
+        timeout_kwargs["timeout"] = remaining
+
     try:
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
+        with smtplib.SMTP_SSL("smtp.gmail.com", 465, **timeout_kwargs) as server:
             server.login(smtp_user, app_password)
             server.sendmail(smtp_user, [to_email], msg.as_string())
         print("[notifier] Email sent via Gmail SMTP.")
+        if out is not None:
+            out.append(to_email)
         return True
     except Exception as e:
         print(f"[notifier] SMTP error: {e}")
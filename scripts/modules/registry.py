@@ -0,0 +1,163 @@
+import importlib
+import os
+import sys
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+
+class Entry(NamedTuple):
+    module: str  # module that defines the callable
+    attr: str  # callable name inside the module
+    imports: List[str]  # heavy third-party/stdlib deps it pulls in (timed separately by --profile-startup)
+    kwargs: Callable[..., Dict[str, Any]]  # builds call kwargs from (prefs, secrets, ...)
+
+
+# Job sources, keyed by the names used in Preferences.job_sources.
+# Source callables must accept `deadline` (time.monotonic() value) and `out` (a scheduler.Collected to
+# append results to as they arrive) keywords, and stop once the deadline passes.
+JOB_SOURCES: Dict[str, Entry] = {
+    "jsearch": Entry(
+        "modules.job_scraper",
+        "fetch_jobs_jsearch",
+        ["requests"],
+        lambda prefs, secrets: dict(
+            rapidapi_key=secrets.rapidapi_key,
+            titles=prefs.titles,
+            locations=prefs.locations_allowed,
+            max_results=100,
+        ),
+    ),
+    # Future: add LinkedIn/Naukri/Indeed/company fetchers
+}
+
+# News sources, keyed by the names used in Preferences.news_sources.
+NEWS_SOURCES: Dict[str, Entry] = {
+    "google_news": Entry(
+        "modules.news_scraper",
+        "fetch_google_news_rss",
+        ["requests", "feedparser"],
+        lambda prefs, secrets: dict(topics=prefs.news_topics, limit_per_topic=2),
+    ),
+}
+
+# Delivery channels; enabled via Preferences.send_<channel>. Callables must accept a `deadline` keyword.
+NOTIFIERS: Dict[str, Entry] = {
+    "whatsapp": Entry(
+        "modules.notifier",
+        "send_whatsapp_via_twilio",
+        ["requests"],
+        lambda prefs, secrets, subject, text, html: dict(
+            account_sid=secrets.twilio_account_sid,
+            auth_token=secrets.twilio_auth_token,
+            from_whatsapp=secrets.twilio_whatsapp_from,
+            to_whatsapp=secrets.whatsapp_to,
+            body=text,
+        ),
+    ),
+    "email": Entry(
+        "modules.notifier",
+        "send_email_via_gmail",
+        ["smtplib", "email.mime.multipart", "email.mime.text"],
+        lambda prefs, secrets, subject, text, html: dict(
+            smtp_user=secrets.smtp_user,
+            app_password=secrets.smtp_app_password,
+            to_email=secrets.email_to,
+            subject=subject,
+            html_body=html,
+            text_body=text,
+        ),
+    ),
+}
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve(entry: Entry) -> Callable[..., Any]:
+    return getattr(importlib.import_module(entry.module), entry.attr)
+
+
+def enabled(registry: Dict[str, Entry], names: List[str]) -> Dict[str, Entry]:
+    out = {}
+    for name in names:
+        entry = registry.get(name)
+        if entry is None:
+            print(f"[registry] Unknown source/channel '{name}' — skipping.")
+            continue
+        out[name] = entry
+    return out
+
+
+def enabled_notifiers(prefs) -> Dict[str, Entry]:
+    names = [name for name in NOTIFIERS if getattr(prefs, f"send_{name}", False)]
+    return enabled(NOTIFIERS, names)
+
+
+def profile_startup(prefs) -> Dict[str, Optional[float]]:
+    """
+    Import main.py and everything a run with these preferences would load in a fresh
+    interpreter under `python -X importtime`; return cumulative import time (ms) per module,
+    or None for modules that failed to import.
+    main.py's own module-level imports are reported one per line (prefixed "main > ").
+    Each entry's heavy deps are imported before the module that uses them, so they get their
+    own line instead of being folded into it.
+    """
+    import subprocess  # only needed here; keep it off the normal startup path
+
+    names = ["main", "dotenv", "modules.filter", "modules.notifier"]
+    entries = (
+        list(enabled(JOB_SOURCES, prefs.job_sources).values())
+        + list(enabled(NEWS_SOURCES, prefs.news_sources).values())
+        + list(enabled_notifiers(prefs).values())
+    )
+    for entry in entries:
+        names += entry.imports + [entry.module]
+    names = list(dict.fromkeys(names))  # unique preserve order
+
+    code = "\n".join(
+        f"try:\n    import {name}\nexcept Exception as e:\n    print(f\"FAILED {name} {{e}}\")"
+        for name in names
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        print(f"[registry] Profiling interpreter exited with {proc.returncode}: {proc.stderr.splitlines()[-1:]}")
+
+    failed = []
+    for line in proc.stdout.splitlines():
+        if line.startswith("FAILED "):
+            _, name, err = line.split(" ", 2)
+            print(f"[registry] Failed to import '{name}': {err}")
+            failed.append(name)
+
+    # Lines look like "import time:  self [us] | cumulative | <indent>name", children before
+    # their parent; indent is two spaces per nesting level.
+    times: Dict[str, Optional[float]] = {}
+    children: List[tuple] = []  # depth-1 imports since the last top-level line
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        if not line.startswith("import time:") or len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0].split(":")[1]), int(parts[1])
+        except ValueError:
+            continue
+        label = parts[2][1:]
+        name = label.lstrip(" ")
+        depth = (len(label) - len(name)) // 2
+        if depth == 1:
+            children.append((name, cumulative_us))
+        elif depth == 0:
+            if name == "main":
+                # Split main.py's cold start into its own imports plus its self time.
+                for child, us in children:
+                    times[f"main > {child}"] = us / 1000
+                times["main"] = self_us / 1000
+            elif name in names and name not in failed:
+                times[name] = cumulative_us / 1000
+            children = []
+    for name in failed:
+        times[name] = None
+    return times
@@ -0,0 +1,159 @@
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Stage order; every stage must have a share in the budget.
+STAGES = ["fetch", "news", "scoring", "rendering", "delivery"]
+DEFAULT_SHARES = {"fetch": 0.45, "news": 0.2, "scoring": 0.05, "rendering": 0.05, "delivery": 0.25}
+
+# Slack between the deadline a stage is told about and the point where it is
+# abandoned, so an in-flight request can finish. Taken out of the stage's own
+# share (at most half of it), never out of later stages' reserve.
+GRACE_SECONDS = 2.0
+
+
+class Collected(list):
+    """
+    Results a stage appends to as they arrive (fetched items, or delivered messages for a
+    notifier). Owned by the scheduler, so whatever is in it survives the stage being abandoned.
+    The stage sets `truncated` when it stops early and drops work.
+    """
+
+    truncated = False
+
+
+class RunBudget:
+    """
+    Run-level time budget. Stages run in STAGES order; each stage may use time up to
+    the run deadline minus the shares reserved for the stages after it, so time left
+    unused by earlier stages rolls forward and later stages (rendering, delivery)
+    always keep their reserve.
+    """
+
+    def __init__(self, total_seconds: float, shares: Dict[str, float]):
+        if total_seconds <= 0:
+            raise ValueError(f"run deadline must be positive, got {total_seconds}")
+        missing = [s for s in STAGES if s not in shares]
+        unknown = [s for s in shares if s not in STAGES]
+        if missing or unknown:
+            raise ValueError(f"stage_budget_shares must have exactly {STAGES}; missing {missing}, unknown {unknown}")
+        if any(v < 0 for v in shares.values()) or sum(shares.values()) > 1.0 + 1e-9:
+            raise ValueError(f"stage_budget_shares must be non-negative and sum to at most 1, got {shares}")
+
+        self.total_seconds = float(total_seconds)
+        self.shares = dict(shares)
+        self.started_at = datetime.utcnow()
+        self.start = time.monotonic()
+        self.deadline = self.start + self.total_seconds
+        self.stages: List[Dict[str, Any]] = []
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+    def stage_deadline(self, stage: str) -> float:
+        later = STAGES[STAGES.index(stage) + 1:]
+        reserve = sum(self.shares[s] for s in later) * self.total_seconds
+        return self.deadline - reserve
+
+    def run(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        fallback: Any,
+        deadline: Optional[float] = None,
+        collect: bool = False,
+    ) -> Any:
+        """
+        Run a stage in a worker thread and return its result, or `fallback` if it is skipped,
+        raises, or overruns. fn is called as fn(soft_deadline), or fn(soft_deadline, out) with
+        collect=True, where soft_deadline is the stage deadline minus a grace period and `out`
+        is a Collected list: on overrun or error its contents are returned instead of `fallback`.
+        A stage that returns False (e.g. a notifier whose send failed) is recorded as failed.
+        """
+        stage = name.split(":", 1)[0]
+        if deadline is None:
+            deadline = self.stage_deadline(stage)
+        deadline = min(deadline, self.deadline)
+
+        begin = time.monotonic()
+        if begin >= deadline:
+            print(f"[scheduler] No time left for '{name}' — skipping.")
+            self._record(name, begin, begin, deadline, "skipped")
+            return fallback
+
+        soft_deadline = deadline - min(GRACE_SECONDS, (deadline - begin) / 2)
+        out = Collected()
+        outcome: Dict[str, Any] = {}
+
+        def target():
+            try:
+                outcome["value"] = fn(soft_deadline, out) if collect else fn(soft_deadline)
+            except Exception as e:
+                outcome["error"] = e
+
+        worker = threading.Thread(target=target, name=f"stage-{name}", daemon=True)
+        worker.start()
+        worker.join(deadline - begin)
+        end = time.monotonic()
+
+        if worker.is_alive():
+            # Threads can't be killed; the daemon worker is abandoned and dies with the process.
+            partial = list(out) if collect else fallback
+            print(f"[scheduler] '{name}' overran its budget ({deadline - begin:.1f}s) — cancelled.")
+            self._record(name, begin, end, deadline, "timeout", **({"items": len(partial)} if collect else {}))
+            return partial
+        if "error" in outcome:
+            partial = list(out) if collect else fallback
+            print(f"[scheduler] '{name}' failed: {outcome['error']}")
+            self._record(name, begin, end, deadline, "error", error=str(outcome["error"]))
+            return partial
+
+        status = "truncated" if out.truncated else "failed" if outcome["value"] is False else "ok"
+        if status == "truncated":
+            print(f"[scheduler] '{name}' stopped at its deadline — using partial results.")
+        elif status == "failed":
+            print(f"[scheduler] '{name}' reported failure.")
+        self._record(name, begin, end, deadline, status)
+        return outcome["value"]
+
+    def run_inline(self, name: str, fn: Callable[[], Any], fallback: Any) -> Any:
+        """
+        Run a short CPU-only stage in the calling thread. It can't be cancelled, so an
+        overrun is only recorded (as timeout); if fn raises, `fallback` is returned.
+        """
+        deadline = min(self.stage_deadline(name), self.deadline)
+        begin = time.monotonic()
+        try:
+            value = fn()
+        except Exception as e:
+            print(f"[scheduler] '{name}' failed: {e}")
+            self._record(name, begin, time.monotonic(), deadline, "error", error=str(e))
+            return fallback
+        end = time.monotonic()
+        if end > deadline:
+            print(f"[scheduler] '{name}' overran its budget ({deadline - begin:.1f}s).")
+        self._record(name, begin, end, deadline, "timeout" if end > deadline else "ok")
+        return value
+
+    def _record(self, name: str, begin: float, end: float, deadline: float, status: str, **extra: Any):
+        entry = {
+            "stage": name,
+            "status": status,
+            "budget_s": round(max(0.0, deadline - begin), 2),
+            "elapsed_s": round(end - begin, 2),
+        }
+        entry.update(extra)
+        self.stages.append(entry)
+
+    def degraded(self) -> List[str]:
+        return [s["stage"] for s in self.stages if s["status"] != "ok"]
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "ts": self.started_at.isoformat(),
+            "deadline_s": self.total_seconds,
+            "elapsed_s": round(time.monotonic() - self.start, 2),
+            "degraded": self.degraded(),
+            "stages": self.stages,
+        }